@@ -53,7 +53,7 @@ from utilities.pytest_utils import (
     prepare_base_path,
     session_teardown,
 )
-from utilities.resources import create_and_store_resource
+from utilities.resources import TeardownRegistry, create_and_store_resource
 from utilities.utils import (
     create_source_cnv_vms,
     create_source_provider,
@@ -117,7 +117,7 @@ def pytest_sessionstart(session):
             pytest.exit(reason=f"Some required config is missing {required_config=} - {missing_configs=}", returncode=1)
 
     _session_store = get_fixture_store(session)
-    _session_store["teardown"] = {}
+    _session_store["teardown"] = TeardownRegistry()
 
     if not session.config.getoption("skip_data_collector"):
         _data_collector_path = Path(session.config.getoption("data_collector_path"))
@@ -732,18 +732,24 @@ def plan(
             name=vm["name"],
             namespace=target_namespace,
         )
-        fixture_store["teardown"].setdefault(vm_obj.kind, []).append({
-            "name": vm_obj.name,
-            "namespace": vm_obj.namespace,
-            "module": vm_obj.__module__,
-        })
+        fixture_store["teardown"].add(
+            kind=vm_obj.kind,
+            entry={
+                "name": vm_obj.name,
+                "namespace": vm_obj.namespace,
+                "module": vm_obj.__module__,
+            },
+        )
 
     for pod in Pod.get(client=ocp_admin_client, namespace=target_namespace):
-        fixture_store["teardown"].setdefault(pod.kind, []).append({
-            "name": pod.name,
-            "namespace": pod.namespace,
-            "module": pod.__module__,
-        })
+        fixture_store["teardown"].add(
+            kind=pod.kind,
+            entry={
+                "name": pod.name,
+                "namespace": pod.namespace,
+                "module": pod.__module__,
+            },
+        )
 
 
 @pytest.fixture(scope="session")
@@ -228,6 +228,33 @@ class OCPProvider(BaseProvider):
 
         return result_vm_info
 
+    def vm_disk_count(self, name: str, namespace: str) -> int:
+        """
+        Return the number of volumes defined in the VM template.
+
+        Reads only the VirtualMachine spec, so unlike vm_dict() it does not start the VM or fetch every PVC.
+
+        Args:
+            name: Name of the VM
+            namespace: Namespace of the VM
+
+        Returns:
+            Number of volumes in the VM template
+
+        Raises:
+            ValueError: If the provider is not connected
+        """
+        if not self.ocp_resource:
+            raise ValueError("Missing `ocp_resource`")
+
+        cnv_vm = VirtualMachine(
+            client=self.ocp_resource.client,
+            name=name,
+            namespace=namespace,
+            ensure_exists=True,
+        )
+        return len(cnv_vm.instance.spec.template.spec.volumes or [])
+
     def clone_vm(self, source_vm_name: str, clone_vm_name: str, session_uuid: str, **kwargs: Any) -> Any:
         return
 
@@ -266,9 +266,7 @@ class OpenStackProvider(BaseProvider):
 
             # Track cloned VM for cleanup immediately after creation
             if self.fixture_store:
-                self.fixture_store["teardown"].setdefault(self.type, []).append({
-                    "name": new_server.name,
-                })
+                self.fixture_store["teardown"].add(kind=self.type, entry={"name": new_server.name})
 
             if not power_on:
                 LOGGER.info(f"power_on is False, stopping server '{new_server.name}'")
@@ -356,9 +356,7 @@ class OvirtProvider(BaseProvider):
 
             # Track cloned VM for cleanup
             if self.fixture_store:
-                self.fixture_store["teardown"].setdefault(self.type, []).append({
-                    "name": clone_vm_name,
-                })
+                self.fixture_store["teardown"].add(kind=self.type, entry={"name": clone_vm_name})
 
             if power_on:
                 self.start_vm(new_vm)
@@ -1192,7 +1192,7 @@ class VMWareProvider(BaseProvider):
                 raise
 
         if res and self.fixture_store:
-            self.fixture_store["teardown"].setdefault(self.type, []).append({"name": clone_vm_name})
+            self.fixture_store["teardown"].add(kind=self.type, entry={"name": clone_vm_name})
 
         # Add RDM disks post-clone (RDM requires VMFS datastore, can't be added during clone on NFS)
         for rdm_config in rdm_disks:
@@ -1,11 +1,14 @@
 import contextlib
+import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from typing import Any
 
 import pytz
+from kubernetes.client.exceptions import ApiException
 from kubernetes.dynamic import DynamicClient
 from kubernetes.dynamic.exceptions import NotFoundError
+from kubernetes.dynamic.resource import ResourceInstance
 from ocp_resources.datavolume import DataVolume
 from ocp_resources.migration import Migration
 from ocp_resources.network_map import NetworkMap
@@ -20,68 +23,209 @@ from pytest import FixtureRequest
 from pytest_testconfig import py_config
 from simple_logger.logger import get_logger
 from timeout_sampler import TimeoutExpiredError
+from urllib3.exceptions import HTTPError
 
 from libs.base_provider import BaseProvider
 from libs.providers.openshift import OCPProvider
 
 LOGGER = get_logger(__name__)
 
+# Default timeout (seconds) to wait for a resource condition, same as ocp_resources wait_for_condition
+CONDITION_WAIT_TIMEOUT: int = 300
 
-def cancel_migration(migration: Migration) -> None:
-    for condition in migration.instance.status.conditions:
-        # Only cancel migrations that are in "Executing" state
-        if condition.type == migration.Condition.Type.RUNNING and condition.status == migration.Condition.Status.TRUE:
-            LOGGER.info(f"Canceling migration {migration.name}")
-
-            migration_spec = migration.instance.spec
-            plan = Plan(client=migration.client, name=migration_spec.plan.name, namespace=migration_spec.plan.namespace)
-            plan_instance = plan.instance
-
-            ResourceEditor(
-                patches={
-                    migration: {
-                        "spec": {
-                            "cancel": plan_instance.spec.vms,
-                        }
-                    }
-                }
-            ).update()
 
-            try:
-                migration.wait_for_condition(
-                    condition=migration.Condition.CANCELED, status=migration.Condition.Status.TRUE
-                )
-                check_dv_pvc_pv_deleted(
-                    ocp_client=migration.client,
-                    target_namespace=plan.instance.spec.targetNamespace,
-                    partial_name=migration.name,
+def is_condition_met(resource_instance: ResourceInstance, condition: str, status: str) -> bool:
+    """
+    Check if a resource instance already has the given condition with the given status.
+
+    Args:
+        resource_instance: Resource instance to check, as returned by resource.instance or a watch event
+        condition: Condition type to look for
+        status: Expected condition status
+
+    Returns:
+        True if the resource instance has the condition with the given status, False otherwise
+    """
+    resource_status = resource_instance.status
+    return any(
+        _condition.type == condition and _condition.status == status
+        for _condition in (resource_status.conditions if resource_status else None) or []
+    )
+
+
+def wait_for_condition_watch(
+    resource: NamespacedResource, condition: str, status: str, timeout: int = CONDITION_WAIT_TIMEOUT
+) -> ResourceInstance:
+    """
+    Wait for a resource condition using a watch stream instead of polling.
+
+    The resource is read once and watched from its resourceVersion, so an already satisfied condition returns
+    immediately and a change between the read and the watch is not missed.
+    Falls back to polling with wait_for_condition if the watch fails.
+
+    Args:
+        resource: Resource to wait for
+        condition: Condition type to wait for
+        status: Expected condition status
+        timeout: Seconds to wait for the condition
+
+    Returns:
+        The resource instance in which the condition was observed, so callers do not need to GET it again
+
+    Raises:
+        TimeoutExpiredError: If the condition was not reached within the timeout
+    """
+    deadline = time.monotonic() + timeout
+
+    try:
+        resource_instance = resource.instance
+        resource_version = resource_instance.metadata.resourceVersion
+
+        while not is_condition_met(resource_instance=resource_instance, condition=condition, status=status):
+            if (remaining := deadline - time.monotonic()) <= 0:
+                raise TimeoutExpiredError(
+                    f"{resource.kind} {resource.name} did not reach condition {condition}={status}"
                 )
-            except TimeoutExpiredError:
-                LOGGER.error(f"Failed to cancel migration {migration.name}")
 
+            for event in resource.watcher(timeout=max(int(remaining), 1), resource_version=resource_version):
+                resource_instance = event["object"]
+                resource_version = resource_instance.metadata.resourceVersion
+                if is_condition_met(resource_instance=resource_instance, condition=condition, status=status):
+                    break
 
-def archive_plan(plan: Plan) -> None:
-    LOGGER.info(f"Archiving plan {plan.name}")
+    except (ApiException, HTTPError) as exc:
+        LOGGER.warning(f"Failed to watch {resource.kind} {resource.name}, falling back to polling: {exc}")
+        resource.wait_for_condition(
+            condition=condition, status=status, timeout=max(int(deadline - time.monotonic()), 1)
+        )
+        return resource.instance
 
-    ResourceEditor(
-        patches={
-            plan: {
-                "spec": {
-                    "archived": True,
-                }
+    return resource_instance
+
+
+def cancel_migrations(migrations: list[Migration]) -> None:
+    """
+    Cancel all running migrations with a single ResourceEditor and wait for them to be canceled.
+
+    Args:
+        migrations: Migrations to cancel, migrations that are not running are skipped
+    """
+    patches: dict[Migration, dict[str, Any]] = {}
+    target_namespaces: dict[Migration, str] = {}
+
+    for migration in migrations:
+        migration_instance = migration.instance
+
+        # Only cancel migrations that are in "Executing" state
+        if not is_condition_met(
+            resource_instance=migration_instance,
+            condition=migration.Condition.Type.RUNNING,
+            status=migration.Condition.Status.TRUE,
+        ):
+            continue
+
+        LOGGER.info(f"Canceling migration {migration.name}")
+
+        migration_spec = migration_instance.spec
+        plan = Plan(client=migration.client, name=migration_spec.plan.name, namespace=migration_spec.plan.namespace)
+        plan_spec = plan.instance.spec
+
+        patches[migration] = {
+            "spec": {
+                "cancel": plan_spec.vms,
             }
         }
-    ).update()
+        target_namespaces[migration] = plan_spec.targetNamespace
 
-    try:
-        plan.wait_for_condition(condition=plan.Condition.ARCHIVED, status=plan.Condition.Status.TRUE)
-        for _pod in Pod.get(client=plan.client, namespace=plan.instance.spec.targetNamespace):
-            if plan.name in _pod.name:
-                if not _pod.wait_deleted():
-                    LOGGER.error(f"Pod {_pod.name} was not deleted after plan {plan.name} was archived")
+    if not patches:
+        return
+
+    ResourceEditor(patches=patches).update()
 
-    except TimeoutExpiredError:
-        LOGGER.error(f"Failed to archive plan {plan.name}")
+    def _wait_for_cancel(migration: Migration, target_namespace: str) -> None:
+        try:
+            wait_for_condition_watch(
+                resource=migration, condition=migration.Condition.CANCELED, status=migration.Condition.Status.TRUE
+            )
+            check_dv_pvc_pv_deleted(
+                ocp_client=migration.client,
+                target_namespace=target_namespace,
+                partial_name=migration.name,
+            )
+        except TimeoutExpiredError:
+            LOGGER.error(f"Failed to cancel migration {migration.name}")
+
+    # Each migration is canceled independently, wait for all of them concurrently
+    with ThreadPoolExecutor(max_workers=min(len(target_namespaces), 10)) as executor:
+        futures = [
+            executor.submit(_wait_for_cancel, migration, target_namespace)
+            for migration, target_namespace in target_namespaces.items()
+        ]
+        for future in as_completed(futures):
+            future.result()
+
+
+def archive_plans(plans: list[Plan]) -> None:
+    """
+    Archive all plans with a single ResourceEditor and wait for their pods to be deleted.
+
+    Args:
+        plans: Plans to archive, plans that are already archived are not patched or waited for
+    """
+    if not plans:
+        return
+
+    plan_instances = {plan: plan.instance for plan in plans}
+    plans_to_archive = [
+        plan
+        for plan, plan_instance in plan_instances.items()
+        if not is_condition_met(
+            resource_instance=plan_instance, condition=plan.Condition.ARCHIVED, status=plan.Condition.Status.TRUE
+        )
+    ]
+
+    if plans_to_archive:
+        LOGGER.info(f"Archiving plans {[plan.name for plan in plans_to_archive]}")
+
+        ResourceEditor(
+            patches={
+                plan: {
+                    "spec": {
+                        "archived": True,
+                    }
+                }
+                for plan in plans_to_archive
+            }
+        ).update()
+
+    def _wait_for_archive(plan: Plan, plan_instance: ResourceInstance) -> None:
+        try:
+            if plan in plans_to_archive:
+                plan_instance = wait_for_condition_watch(
+                    resource=plan, condition=plan.Condition.ARCHIVED, status=plan.Condition.Status.TRUE
+                )
+
+            for _pod in pods_by_namespace[plan_instance.spec.targetNamespace]:
+                if plan.name in _pod.name:
+                    if not _pod.wait_deleted():
+                        LOGGER.error(f"Pod {_pod.name} was not deleted after plan {plan.name} was archived")
+
+        except TimeoutExpiredError:
+            LOGGER.error(f"Failed to archive plan {plan.name}")
+
+    # Plans usually share a target namespace, list the pods of each target namespace once for all plans
+    pods_by_namespace: dict[str, list[Pod]] = {
+        target_namespace: list(Pod.get(client=plans[0].client, namespace=target_namespace))
+        for target_namespace in {plan_instance.spec.targetNamespace for plan_instance in plan_instances.values()}
+    }
+
+    # Plans are archived independently, wait for all of them concurrently
+    with ThreadPoolExecutor(max_workers=min(len(plan_instances), 10)) as executor:
+        futures = [
+            executor.submit(_wait_for_archive, plan, plan_instance) for plan, plan_instance in plan_instances.items()
+        ]
+        for future in as_completed(futures):
+            future.result()
 
 
 def check_dv_pvc_pv_deleted(
@@ -92,7 +236,8 @@ def check_dv_pvc_pv_deleted(
 ) -> dict[str, list[dict[str, str]]]:
     """
     Check and wait for DataVolumes, PVCs, and PVs to be deleted in parallel.
-    Order is maintained: DVs → PVCs → PVs, but within each group resources are checked in parallel.
+    DVs and PVCs are waited for together, PVs are checked only after them since a PV is released
+    only once its PVC is gone.
     """
     if leftovers is None:
         leftovers = {}
@@ -108,64 +253,66 @@ def check_dv_pvc_pv_deleted(
             LOGGER.error(f"Failed to wait for {resource_type} {resource.name} deletion: {exc}")
             return {"success": False, "resource": resource, "type": resource_type}
 
-    # Check DataVolumes in parallel
-    dvs_to_wait = []
+    def wait_for_resources_deletion(resources_to_wait: list[tuple[Resource, str]]) -> list[Resource]:
+        """Wait for all resources deletion in parallel and return the ones that were not deleted."""
+        with ThreadPoolExecutor(max_workers=min(len(resources_to_wait), 10)) as executor:
+            futures = [
+                executor.submit(wait_for_resource_deletion, resource, resource_type)
+                for resource, resource_type in resources_to_wait
+            ]
+            not_deleted: list[Resource] = []
+            for future in as_completed(futures):
+                result = future.result()
+                if not result["success"]:
+                    not_deleted.append(result["resource"])
+
+        return not_deleted
+
+    # Check DataVolumes and PVCs in parallel
+    dvs_and_pvcs_to_wait: list[tuple[Resource, str]] = []
     try:
-        dvs_to_wait = [
-            _dv for _dv in DataVolume.get(client=ocp_client, namespace=target_namespace) if partial_name in _dv.name
-        ]
+        dvs_and_pvcs_to_wait.extend(
+            (_dv, "DataVolume")
+            for _dv in DataVolume.get(client=ocp_client, namespace=target_namespace)
+            if partial_name in _dv.name
+        )
     except Exception as exc:
         LOGGER.error(f"Failed to get DataVolumes: {exc}")
 
-    if dvs_to_wait:
-        LOGGER.info(f"Waiting for {len(dvs_to_wait)} DataVolumes to be deleted in parallel...")
-        with ThreadPoolExecutor(max_workers=min(len(dvs_to_wait), 10)) as executor:
-            future_to_dv = {executor.submit(wait_for_resource_deletion, dv, "DataVolume"): dv for dv in dvs_to_wait}
-            for future in as_completed(future_to_dv):
-                result = future.result()
-                if not result["success"]:
-                    leftovers = append_leftovers(leftovers=leftovers, resource=result["resource"])
-
-    # Check PVCs in parallel
-    pvcs_to_wait = []
     try:
-        pvcs_to_wait = [
-            _pvc
+        dvs_and_pvcs_to_wait.extend(
+            (_pvc, "PVC")
             for _pvc in PersistentVolumeClaim.get(client=ocp_client, namespace=target_namespace)
             if partial_name in _pvc.name
-        ]
+        )
     except Exception as exc:
         LOGGER.error(f"Failed to get PVCs: {exc}")
 
-    if pvcs_to_wait:
-        LOGGER.info(f"Waiting for {len(pvcs_to_wait)} PVCs to be deleted in parallel...")
-        with ThreadPoolExecutor(max_workers=min(len(pvcs_to_wait), 10)) as executor:
-            future_to_pvc = {executor.submit(wait_for_resource_deletion, pvc, "PVC"): pvc for pvc in pvcs_to_wait}
-            for future in as_completed(future_to_pvc):
-                result = future.result()
-                if not result["success"]:
-                    leftovers = append_leftovers(leftovers=leftovers, resource=result["resource"])
+    if dvs_and_pvcs_to_wait:
+        LOGGER.info(f"Waiting for {len(dvs_and_pvcs_to_wait)} DataVolumes and PVCs to be deleted in parallel...")
+        for resource in wait_for_resources_deletion(resources_to_wait=dvs_and_pvcs_to_wait):
+            leftovers = append_leftovers(leftovers=leftovers, resource=resource)
 
     # Check PVs in parallel
-    pvs_to_wait = []
+    pvs_to_wait: list[tuple[Resource, str]] = []
     try:
-        for _pv in PersistentVolume.get(client=ocp_client):
-            with contextlib.suppress(NotFoundError):
-                _pv_spec = _pv.instance.spec.to_dict()
-                if partial_name in _pv_spec.get("claimRef", {}).get("name", ""):
-                    if _pv.instance.status.phase != _pv.Status.RELEASED:
-                        pvs_to_wait.append(_pv)
+        # List PVs once and filter the items, wrapping each PV would cost an extra GET per PV in the cluster.
+        # PersistentVolume.get(raw=True) cannot be used: for cluster-scoped kinds it yields the whole list once per
+        # item, and a PersistentVolume cannot be built without a name to reach its api, so the API is looked up the
+        # same way the wrapper's Resource.full_api does.
+        pv_api = ocp_client.resources.get(api_version=PersistentVolume.api_version, kind=PersistentVolume.kind)
+        for _pv in pv_api.get().items:
+            _claim_ref = _pv.spec.claimRef
+            if _claim_ref and partial_name in (_claim_ref.name or ""):
+                if _pv.status.phase != PersistentVolume.Status.RELEASED:
+                    pvs_to_wait.append((PersistentVolume(client=ocp_client, name=_pv.metadata.name), "PV"))
     except Exception as exc:
         LOGGER.error(f"Failed to get PVs: {exc}")
 
     if pvs_to_wait:
         LOGGER.info(f"Waiting for {len(pvs_to_wait)} PVs to be deleted in parallel...")
-        with ThreadPoolExecutor(max_workers=min(len(pvs_to_wait), 10)) as executor:
-            future_to_pv = {executor.submit(wait_for_resource_deletion, pv, "PV"): pv for pv in pvs_to_wait}
-            for future in as_completed(future_to_pv):
-                result = future.result()
-                if not result["success"]:
-                    leftovers = append_leftovers(leftovers=leftovers, resource=result["resource"])
+        for resource in wait_for_resources_deletion(resources_to_wait=pvs_to_wait):
+            leftovers = append_leftovers(leftovers=leftovers, resource=resource)
 
     return leftovers
 
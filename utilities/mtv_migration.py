@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any
 
@@ -7,12 +10,11 @@ from kubernetes.dynamic import DynamicClient
 from ocp_resources.migration import Migration
 from ocp_resources.network_map import NetworkMap
 from ocp_resources.plan import Plan
-from ocp_resources.provider import Provider
 from ocp_resources.storage_map import StorageMap
 from pytest import FixtureRequest
 from pytest_testconfig import py_config
 from simple_logger.logger import get_logger
-from timeout_sampler import TimeoutExpiredError, TimeoutSampler
+from timeout_sampler import TimeoutExpiredError
 
 from exceptions.exceptions import MigrationPlanExecError
 from libs.base_provider import BaseProvider
@@ -28,6 +30,10 @@ from utilities.utils import gen_network_map_list, get_value_from_py_config
 
 LOGGER = get_logger(__name__)
 
+# Polling interval bounds (seconds) while waiting for a migration plan to complete
+MIGRATION_POLL_INITIAL_SLEEP: float = 1
+MIGRATION_POLL_MAX_SLEEP: float = 30
+
 
 def migrate_vms(
     ocp_admin_client: DynamicClient,
@@ -190,14 +196,9 @@ def run_migration(
         plan.wait_for_condition(condition=Plan.Condition.READY, status=Plan.Condition.Status.TRUE, timeout=360)
     except TimeoutExpiredError:
         LOGGER.error(f"Plan {plan.name} failed to reach status {Plan.Condition.Status.TRUE}\n\t{plan.instance}")
-        source_provider = Provider(
-            client=ocp_admin_client, name=source_provider_name, namespace=source_provider_namespace
-        )
-        dest_provider = Provider(
-            client=ocp_admin_client, name=destination_provider_name, namespace=destination_provider_namespace
-        )
-        LOGGER.error(f"Source provider: {source_provider.instance}")
-        LOGGER.error(f"Destinaion provider: {dest_provider.instance}")
+        # Provider status is already part of the Plan conditions, avoid extra API calls on the failure path
+        LOGGER.error(f"Source provider: {source_provider_namespace}/{source_provider_name}")
+        LOGGER.error(f"Destination provider: {destination_provider_namespace}/{destination_provider_name}")
         raise
 
     # Wait for Forklift to create plan-specific secret for copy-offload (race condition)
@@ -243,13 +244,18 @@ def wait_for_migration_complate(plan: Plan) -> None:
 
     try:
         last_status: str = ""
+        wait_timeout: int = py_config.get("plan_wait_timeout", 600)
+        deadline = time.monotonic() + wait_timeout
+        delay: float = MIGRATION_POLL_INITIAL_SLEEP
+
+        while time.monotonic() < deadline:
+            try:
+                sample = _wait_for_migration_complate(_plan=plan)
+            except Exception as exc:
+                # Same as TimeoutSampler, keep polling through transient API errors until the deadline
+                LOGGER.warning(f"Failed to get plan '{plan.name}' migration status, retrying: {exc}")
+                sample = last_status
 
-        for sample in TimeoutSampler(
-            func=_wait_for_migration_complate,
-            sleep=1,
-            wait_timeout=py_config.get("plan_wait_timeout", 600),
-            _plan=plan,
-        ):
             if sample != last_status:
                 LOGGER.info(f"Plan '{plan.name}' migration status: '{sample}'")
                 last_status = sample
@@ -260,6 +266,12 @@ def wait_for_migration_complate(plan: Plan) -> None:
             elif sample == Plan.Status.FAILED:
                 raise MigrationPlanExecError()
 
+            # Back off exponentially (with jitter) so long migrations do not hammer the API server
+            time.sleep(min(delay + random.uniform(0, 0.1 * delay), max(deadline - time.monotonic(), 0)))
+            delay = min(delay * 1.5, MIGRATION_POLL_MAX_SLEEP)
+
+        raise TimeoutExpiredError(f"Plan {plan.name} did not complete within {wait_timeout} seconds")
+
     except (TimeoutExpiredError, MigrationPlanExecError):
         raise MigrationPlanExecError(
             f"Plan {plan.name} failed to reach the expected condition. \nstatus:\n\t{plan.instance}"
@@ -322,9 +334,6 @@ def get_storage_migration_map(
     # Determine storage class (from parameter or config)
     target_storage_class: str = storage_class or py_config["storage_class"]
 
-    # Build storage map list based on migration type
-    storage_map_list: list[dict[str, Any]] = []
-
     # Check if copy-offload parameters are provided
     if secondary_datastore_id and not datastore_id:
         raise ValueError("secondary_datastore_id requires datastore_id to be set")
@@ -332,6 +341,8 @@ def get_storage_migration_map(
     if datastore_id and not offload_plugin_config:
         raise ValueError("datastore_id requires offload_plugin_config to be set")
 
+    # Build storage map list based on migration type
+    storage_map_list: list[dict[str, Any]]
     if datastore_id and offload_plugin_config:
         # Copy-offload migration mode
         datastores_to_map = [datastore_id]
@@ -341,32 +352,29 @@ def get_storage_migration_map(
         else:
             LOGGER.info(f"Creating copy-offload storage map for primary datastore: {datastore_id}")
 
-        # Create a storage map entry for each datastore
-        for ds_id in datastores_to_map:
-            destination_config = {
-                "storageClass": target_storage_class,
-            }
-
-            # Add copy-offload specific destination settings
-            if access_mode:
-                destination_config["accessMode"] = access_mode
-            if volume_mode:
-                destination_config["volumeMode"] = volume_mode
+        # Shared destination settings for every datastore entry, including copy-offload specific ones
+        destination_config: dict[str, str] = {"storageClass": target_storage_class}
+        if access_mode:
+            destination_config["accessMode"] = access_mode
+        if volume_mode:
+            destination_config["volumeMode"] = volume_mode
 
-            storage_map_list.append({
-                "destination": destination_config,
+        # Create a storage map entry for each datastore
+        storage_map_list = [
+            {
+                "destination": dict(destination_config),
                 "source": {"id": ds_id},
                 "offloadPlugin": offload_plugin_config,
-            })
-            LOGGER.info(f"Added storage map entry for datastore: {ds_id}")
+            }
+            for ds_id in datastores_to_map
+        ]
+        LOGGER.info(f"Added storage map entries for datastores: {datastores_to_map}")
     else:
         LOGGER.info(f"Creating standard storage map for VMs: {vms}")
-        storage_migration_map = source_provider_inventory.vms_storages_mappings(vms=vms)
-        for storage in storage_migration_map:
-            storage_map_list.append({
-                "destination": {"storageClass": target_storage_class},
-                "source": storage,
-            })
+        storage_map_list = [
+            {"destination": {"storageClass": target_storage_class}, "source": storage}
+            for storage in source_provider_inventory.vms_storages_mappings(vms=vms)
+        ]
 
     storage_map = create_and_store_resource(
         fixture_store=fixture_store,
@@ -429,52 +437,57 @@ def create_storagemap_and_networkmap(
     target_namespace: str,
 ) -> tuple[StorageMap, NetworkMap]:
     vms = [vm["name"] for vm in plan["virtual_machines"]]
-    storage_migration_map = get_storage_migration_map(
-        fixture_store=fixture_store,
-        target_namespace=target_namespace,
-        source_provider=source_provider,
-        destination_provider=destination_provider,
-        source_provider_inventory=source_provider_inventory,
-        ocp_admin_client=ocp_admin_client,
-        vms=vms,
-    )
 
-    network_migration_map = get_network_migration_map(
-        fixture_store=fixture_store,
-        source_provider=source_provider,
-        destination_provider=destination_provider,
-        source_provider_inventory=source_provider_inventory,
-        ocp_admin_client=ocp_admin_client,
-        multus_network_name=multus_network_name,
-        target_namespace=target_namespace,
-        vms=vms,
-    )
+    # StorageMap and NetworkMap are independent, create them in parallel
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        storage_map_future = executor.submit(
+            get_storage_migration_map,
+            fixture_store=fixture_store,
+            target_namespace=target_namespace,
+            source_provider=source_provider,
+            destination_provider=destination_provider,
+            source_provider_inventory=source_provider_inventory,
+            ocp_admin_client=ocp_admin_client,
+            vms=vms,
+        )
+        network_map_future = executor.submit(
+            get_network_migration_map,
+            fixture_store=fixture_store,
+            source_provider=source_provider,
+            destination_provider=destination_provider,
+            source_provider_inventory=source_provider_inventory,
+            ocp_admin_client=ocp_admin_client,
+            multus_network_name=multus_network_name,
+            target_namespace=target_namespace,
+            vms=vms,
+        )
+        storage_migration_map = storage_map_future.result()
+        network_migration_map = network_map_future.result()
+
     return storage_migration_map, network_migration_map
 
 
 def verify_vm_disk_count(destination_provider, plan, target_namespace):
     """
-    Verifies that the number of disks on the migrated VM matches the expected count from the plan.
+    Verifies that the number of disks on each migrated VM matches the expected count from the plan.
 
     Args:
         destination_provider: The provider object for the destination cluster (OCP).
         plan (dict): The test plan dictionary containing VM configuration.
-        target_namespace (str): The namespace where the VM was migrated.
+        target_namespace (str): The namespace where the VMs were migrated.
     """
-    LOGGER.info("Verifying disks on migrated VM in OpenShift.")
-    vm_config = plan["virtual_machines"][0]
-    source_vm_name = vm_config["name"]
+    LOGGER.info("Verifying disks on migrated VMs in OpenShift.")
+    for vm_config in plan["virtual_machines"]:
+        source_vm_name = vm_config["name"]
 
-    # Calculate expected disks: 1 base disk + number of disks in "add_disks"
-    num_added_disks = len(vm_config.get("add_disks", []))
-    expected_disks = 1 + num_added_disks
+        # Calculate expected disks: 1 base disk + number of disks in "add_disks"
+        expected_disks = 1 + len(vm_config.get("add_disks", []))
 
-    LOGGER.info(f"Fetching details for migrated VM: {source_vm_name} in namespace {target_namespace}")
-    migrated_vm_info = destination_provider.vm_dict(name=source_vm_name, namespace=target_namespace)
-    num_disks_migrated = len(migrated_vm_info.get("disks", []))
-    LOGGER.info(f"Found {num_disks_migrated} disks on migrated VM '{source_vm_name}'. Expecting {expected_disks}.")
+        LOGGER.info(f"Fetching disk count for migrated VM: {source_vm_name} in namespace {target_namespace}")
+        num_disks_migrated = destination_provider.vm_disk_count(name=source_vm_name, namespace=target_namespace)
+        LOGGER.info(f"Found {num_disks_migrated} disks on migrated VM '{source_vm_name}'. Expecting {expected_disks}.")
 
-    assert num_disks_migrated == expected_disks, (
-        f"Expected {expected_disks} disks on migrated VM, but found {num_disks_migrated}."
-    )
-    LOGGER.info(f"Successfully verified {expected_disks} disks on the migrated VM.")
+        assert num_disks_migrated == expected_disks, (
+            f"Expected {expected_disks} disks on migrated VM '{source_vm_name}', but found {num_disks_migrated}."
+        )
+        LOGGER.info(f"Successfully verified {expected_disks} disks on the migrated VM '{source_vm_name}'.")
@@ -1,6 +1,6 @@
-import shlex
 from pathlib import Path
 
+from kubernetes.dynamic import DynamicClient
 from ocp_resources.cluster_service_version import ClusterServiceVersion
 from ocp_resources.subscription import Subscription
 from pyhelper_utils.shell import run_command
@@ -11,37 +11,60 @@ from utilities.utils import get_cluster_client
 
 LOGGER = get_logger(__name__)
 
+# Resolved must-gather image per MTV namespace, the CSV does not change during a test session
+_MG_IMAGE_CACHE: dict[str, str] = {}
+
+
+def _resolve_must_gather_image(ocp_admin_client: DynamicClient, mtv_namespace: str) -> str:
+    """
+    Find the must-gather image of the installed MTV operator and cache it per MTV namespace.
+
+    Args:
+        ocp_admin_client: OpenShift admin client
+        mtv_namespace: Namespace where the MTV operator is installed
+
+    Returns:
+        The must-gather image from the MTV ClusterServiceVersion, or the upstream image if none is set
+    """
+    mtv_subs = Subscription(client=ocp_admin_client, name="mtv-operator", namespace=mtv_namespace, ensure_exists=True)
+
+    installed_csv = mtv_subs.instance.status.installedCSV
+    mtv_csv = ClusterServiceVersion(
+        client=ocp_admin_client, name=installed_csv, namespace=mtv_namespace, ensure_exists=True
+    )
+
+    mtv_envs = mtv_csv.instance.spec.install.spec.deployments[0].spec.template.spec.containers[0].env
+    must_gather_images = [env["value"] for env in mtv_envs if env["name"] == "MUST_GATHER_IMAGE"]
+
+    if not must_gather_images:
+        LOGGER.warning("Can't find any must-gather image under MTV ClusterServiceVersion using upsream image")
+        must_gather_images = ["quay.io/kubev2v/forklift-must-gather:latest"]
+
+    _MG_IMAGE_CACHE[mtv_namespace] = must_gather_images[0]
+    return must_gather_images[0]
+
 
 def run_must_gather(data_collector_path: Path, plan: dict[str, str] | None = None) -> None:
     try:
         # https://github.com/kubev2v/forklift-must-gather
-        ocp_admin_client = get_cluster_client()
         mtv_namespace = py_config["mtv_namespace"]
-        mtv_subs = Subscription(
-            client=ocp_admin_client, name="mtv-operator", namespace=mtv_namespace, ensure_exists=True
-        )
-
-        installed_csv = mtv_subs.instance.status.installedCSV
-        mtv_csv = ClusterServiceVersion(
-            client=ocp_admin_client, name=installed_csv, namespace=mtv_namespace, ensure_exists=True
+        must_gather_image = _MG_IMAGE_CACHE.get(mtv_namespace) or _resolve_must_gather_image(
+            ocp_admin_client=get_cluster_client(), mtv_namespace=mtv_namespace
         )
 
-        mtv_envs = mtv_csv.instance.spec.install.spec.deployments[0].spec.template.spec.containers[0].env
-        must_gather_images = [env["value"] for env in mtv_envs if env["name"] == "MUST_GATHER_IMAGE"]
-
-        if not must_gather_images:
-            LOGGER.warning("Can't find any must-gather image under MTV ClusterServiceVersion using upsream image")
-            must_gather_images = ["quay.io/kubev2v/forklift-must-gather:latest"]
-
-        _must_gather_base_cmd = f"oc adm must-gather --image={must_gather_images[0]} --dest-dir={data_collector_path}"
+        must_gather_cmd = [
+            "oc",
+            "adm",
+            "must-gather",
+            f"--image={must_gather_image}",
+            f"--dest-dir={data_collector_path}",
+        ]
 
         if plan:
-            plan_name = plan["name"]
-            plan_namespace = plan["namespace"]
-            run_command(
-                shlex.split(f"{_must_gather_base_cmd} -- NS={plan_namespace} PLAN={plan_name} /usr/bin/targeted")
-            )
+            must_gather_cmd.extend(["--", f"NS={plan['namespace']}", f"PLAN={plan['name']}", "/usr/bin/targeted"])
         else:
-            run_command(shlex.split(f"{_must_gather_base_cmd} -- -- NS={mtv_namespace}"))
+            must_gather_cmd.extend(["--", "--", f"NS={mtv_namespace}"])
+
+        run_command(must_gather_cmd)
     except Exception as ex:
         LOGGER.error(f"Failed to run musg-gather. {ex}")
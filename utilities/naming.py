@@ -1,7 +1,11 @@
 import shortuuid
 
+# Reused for every generated name instead of building a new ShortUUID (and its alphabet) per call
+_SHORT_UUID = shortuuid.ShortUUID()
+
+# Characters that are not valid in Kubernetes resource names
+_NAME_SANITIZE_TABLE = str.maketrans({"_": "-", ".": "-"})
+
 
 def generate_name_with_uuid(name: str) -> str:
-    _name = f"{name}-{shortuuid.ShortUUID().random(length=4).lower()}"
-    _name = _name.replace("_", "-").replace(".", "-").lower()
-    return _name
+    return f"{name}-{_SHORT_UUID.random(length=4)}".translate(_NAME_SANITIZE_TABLE).lower()
@@ -464,32 +464,37 @@ def check_static_ip_preservation(
     LOGGER.info(f"Static IP preservation verification completed for VM {vm_name}")
 
 
-def get_destination(map_resource: NetworkMap | StorageMap, source_vm_nic: dict[str, Any]) -> dict[str, Any]:
+def get_map_destinations(map_resource: NetworkMap | StorageMap) -> dict[str, dict[str, Any]]:
     """
-    Get the source_name's (Network Or Storage) destination_name in a migration map.
+    Index a migration map (Network Or Storage) destinations by their source type, name and id.
+
+    The first map entry matching a source identifier wins, like a linear scan over the map.
     """
+    destinations: dict[str, dict[str, Any]] = {}
+
     for map_item in map_resource.instance.spec.map:
         result = {"name": "pod"} if map_item.destination.type == "pod" else map_item.destination
+        source_name = map_item.source.name
+        if source_name and "/" in source_name:
+            source_name = source_name.split("/")[1]
 
-        source_vm_network = source_vm_nic["network"]
+        for source_key in (map_item.source.type, source_name, map_item.source.id):
+            if source_key:
+                destinations.setdefault(source_key, result)
 
-        if isinstance(source_vm_network, dict):
-            source_vm_network = source_vm_network.get("name", source_vm_network.get("id", None))
+    return destinations
 
-        if map_item.source.type and map_item.source.type == source_vm_network:
-            return result
 
-        if map_item.source.name:
-            name_to_compare = (
-                map_item.source.name.split("/")[1] if "/" in map_item.source.name else map_item.source.name
-            )
-            if name_to_compare == source_vm_network:
-                return result
+def get_destination(map_destinations: dict[str, dict[str, Any]], source_vm_nic: dict[str, Any]) -> dict[str, Any]:
+    """
+    Get the source_name's (Network Or Storage) destination_name from an index built by get_map_destinations.
+    """
+    source_vm_network = source_vm_nic["network"]
 
-        if map_item.source.id and map_item.source.id == source_vm_network:
-            return result
+    if isinstance(source_vm_network, dict):
+        source_vm_network = source_vm_network.get("name", source_vm_network.get("id", None))
 
-    return {}
+    return map_destinations.get(source_vm_network, {})
 
 
 def check_cpu(source_vm: dict[str, Any], destination_vm: dict[str, Any]) -> None:
@@ -519,41 +524,43 @@ def check_memory(source_vm: dict[str, Any], destination_vm: dict[str, Any]) -> N
     assert source_vm["memory_in_mb"] == destination_vm["memory_in_mb"]
 
 
-def get_nic_by_mac(nics: list[dict[str, Any]], mac_address: str) -> dict[str, Any]:
-    return [nic for nic in nics if nic["macAddress"] == mac_address][0]
-
-
 def check_network(source_vm: dict[str, Any], destination_vm: dict[str, Any], network_migration_map: NetworkMap) -> None:
+    map_destinations = get_map_destinations(map_resource=network_migration_map)
+    destination_nics_by_mac = {nic["macAddress"]: nic for nic in destination_vm["network_interfaces"]}
+
     for source_vm_nic in source_vm["network_interfaces"]:
-        expected_network = get_destination(network_migration_map, source_vm_nic)
+        expected_network = get_destination(map_destinations=map_destinations, source_vm_nic=source_vm_nic)
 
         assert expected_network, "Network not found in migration map"
 
         expected_network_name = expected_network["name"]
 
-        destination_vm_nic = get_nic_by_mac(
-            nics=destination_vm["network_interfaces"], mac_address=source_vm_nic["macAddress"]
-        )
+        destination_vm_nic = destination_nics_by_mac[source_vm_nic["macAddress"]]
 
         assert destination_vm_nic["network"] == expected_network_name
 
 
 def check_storage(source_vm: dict[str, Any], destination_vm: dict[str, Any], storage_map_resource: StorageMap) -> None:
     destination_disks = destination_vm["disks"]
-    source_vm_disks_storage = [disk["storage"]["name"] for disk in source_vm["disks"]]
+    source_vm_disks_storage = {disk["storage"]["name"] for disk in source_vm["disks"]}
 
     assert len(destination_disks) == len(source_vm["disks"]), "disks count"
 
+    # Expected access mode per storage map entry used by the VM, read once for all disks
+    expected_access_modes: list[str] = []
+    if any(disk["storage"]["name"] == "ocs-storagecluster-ceph-rbd" for disk in destination_disks):
+        expected_access_modes = [
+            # The following condition is for a customer case (BZ#2064936)
+            DataVolume.AccessMode.RWO if mapping.destination.get("accessMode") else DataVolume.AccessMode.RWX
+            for mapping in storage_map_resource.instance.spec.map
+            if mapping.source.name in source_vm_disks_storage
+        ]
+
     for destination_disk in destination_disks:
         assert destination_disk["storage"]["name"] == py_config["storage_class"], "storage class"
         if destination_disk["storage"]["name"] == "ocs-storagecluster-ceph-rbd":
-            for mapping in storage_map_resource.instance.spec.map:
-                if mapping.source.name in source_vm_disks_storage:
-                    # The following condition is for a customer case (BZ#2064936)
-                    if mapping.destination.get("accessMode"):
-                        assert destination_disk["storage"]["access_mode"][0] == DataVolume.AccessMode.RWO
-                    else:
-                        assert destination_disk["storage"]["access_mode"][0] == DataVolume.AccessMode.RWX
+            for expected_access_mode in expected_access_modes:
+                assert destination_disk["storage"]["access_mode"][0] == expected_access_mode
 
 
 def check_pvc_names(
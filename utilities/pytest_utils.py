@@ -1,5 +1,6 @@
 import contextlib
 import json
+import os
 import shutil
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
@@ -14,6 +15,7 @@ from ocp_resources.network_map import NetworkMap
 from ocp_resources.plan import Plan
 from ocp_resources.pod import Pod
 from ocp_resources.provider import Provider
+from ocp_resources.resource import NamespacedResource, Resource
 from ocp_resources.secret import Secret
 from ocp_resources.storage_map import StorageMap
 from ocp_resources.virtual_machine import VirtualMachine
@@ -23,11 +25,14 @@ from exceptions.exceptions import SessionTeardownError
 from libs.providers.openstack import OpenStackProvider
 from libs.providers.rhv import OvirtProvider
 from libs.providers.vmware import VMWareProvider
-from utilities.migration_utils import append_leftovers, archive_plan, cancel_migration, check_dv_pvc_pv_deleted
+from utilities.migration_utils import append_leftovers, archive_plans, cancel_migrations, check_dv_pvc_pv_deleted
 from utilities.utils import delete_all_vms, get_cluster_client
 
 LOGGER = get_logger(__name__)
 
+# Max parallel API calls while deleting teardown resources of all kinds, within the client default connection pool
+TEARDOWN_MAX_WORKERS: int = 10
+
 
 def prepare_base_path(base_path: Path) -> None:
     with contextlib.suppress(FileNotFoundError):
@@ -42,16 +47,26 @@ def collect_created_resources(session_store: dict[str, Any], data_collector_path
     """
     collect created resources and store them in resource.json file under data collector path
     """
-    resources = session_store["teardown"]
+    resources = session_store["teardown"].snapshot()
 
-    if resources:
-        try:
-            LOGGER.info(f"Write created resources data to {data_collector_path}/resources.json")
-            with open(data_collector_path / "resources.json", "w") as fd:
-                json.dump(session_store["teardown"], fd)
+    resources_count = {kind: len(entries) for kind, entries in resources.items() if entries}
+
+    # Nothing to write if no resources were registered
+    if not resources_count:
+        return
+
+    resources_file = data_collector_path / "resources.json"
+    # Per process temporary file, xdist workers share the data collector path
+    tmp_resources_file = data_collector_path / f"resources.json.{os.getpid()}.tmp"
+    try:
+        LOGGER.info(f"Write created resources data ({resources_count}) to {resources_file}")
+        # Write to a temporary file and rename it so resources.json is never left partially written
+        tmp_resources_file.write_text(json.dumps(resources))
+        tmp_resources_file.replace(resources_file)
 
-        except Exception as ex:
-            LOGGER.error(f"Failed to store resources.json due to: {ex}")
+    except Exception as ex:
+        LOGGER.error(f"Failed to store resources.json due to: {ex}")
+        tmp_resources_file.unlink(missing_ok=True)
 
 
 def session_teardown(session_store: dict[str, Any]) -> None:
@@ -60,14 +75,22 @@ def session_teardown(session_store: dict[str, Any]) -> None:
     ocp_client = get_cluster_client()
 
     # When running in parallel (-n auto) `session_store` can be empty.
-    if session_teardown_resources := session_store.get("teardown"):
-        for migration_name in session_teardown_resources.get(Migration.kind, []):
-            migration = Migration(name=migration_name["name"], namespace=migration_name["namespace"], client=ocp_client)
-            cancel_migration(migration=migration)
-
-        for plan_name in session_teardown_resources.get(Plan.kind, []):
-            plan = Plan(name=plan_name["name"], namespace=plan_name["namespace"], client=ocp_client)
-            archive_plan(plan=plan)
+    if session_store.get("teardown"):
+        # Iterate a copy so resources registered meanwhile do not change it
+        session_teardown_resources = session_store["teardown"].snapshot()
+
+        cancel_migrations(
+            migrations=[
+                Migration(name=migration["name"], namespace=migration["namespace"], client=ocp_client)
+                for migration in session_teardown_resources.get(Migration.kind, [])
+            ]
+        )
+        archive_plans(
+            plans=[
+                Plan(name=plan["name"], namespace=plan["namespace"], client=ocp_client)
+                for plan in session_teardown_resources.get(Plan.kind, [])
+            ]
+        )
 
         leftovers = teardown_resources(
             session_store=session_store,
@@ -78,6 +101,69 @@ def session_teardown(session_store: dict[str, Any]) -> None:
             raise SessionTeardownError(f"Failed to clean up the following resources: {leftovers}")
 
 
+def clean_up_resources(
+    resources_to_clean: list[tuple[type[Resource], list[dict[str, str]], bool]],
+    ocp_client: DynamicClient,
+    leftovers: dict[str, list[dict[str, str]]],
+) -> dict[str, list[dict[str, str]]]:
+    """
+    Delete resources of several kinds in one bounded pool and add the ones that failed to the leftovers.
+
+    Args:
+        resources_to_clean: Resource class, resources as stored in the fixture store (name, and namespace for
+            namespaced kinds) and whether to skip resources that no longer exist, for each kind
+        ocp_client: OpenShift client
+        leftovers: Leftovers dict to update
+
+    Returns:
+        The updated leftovers dict
+    """
+    resources = [
+        (resource_cls, resource, only_existing)
+        for resource_cls, kind_resources, only_existing in resources_to_clean
+        for resource in kind_resources
+    ]
+    if not resources:
+        return leftovers
+
+    def _clean_up(
+        resource_cls: type[Resource], resource: dict[str, str], only_existing: bool
+    ) -> tuple[Resource | None, bool]:
+        try:
+            resource_obj: Resource
+            if issubclass(resource_cls, NamespacedResource):
+                resource_obj = resource_cls(name=resource["name"], namespace=resource["namespace"], client=ocp_client)
+            else:
+                resource_obj = resource_cls(name=resource["name"], client=ocp_client)
+
+            if only_existing and not resource_obj.exists:
+                return resource_obj, True
+
+            return resource_obj, bool(resource_obj.clean_up(wait=True))
+        except Exception as exc:
+            LOGGER.error(f"Failed to cleanup {resource_cls.kind} {resource['name']}: {exc}")
+            return None, False
+
+    # A single pool for all kinds keeps the concurrent requests within the client connection pool
+    with ThreadPoolExecutor(max_workers=min(len(resources), TEARDOWN_MAX_WORKERS)) as executor:
+        futures = {
+            executor.submit(_clean_up, resource_cls, resource, only_existing): (resource_cls, resource)
+            for resource_cls, resource, only_existing in resources
+        }
+        for future in as_completed(futures):
+            resource_obj, cleaned = future.result()
+            if cleaned:
+                continue
+
+            if resource_obj:
+                leftovers = append_leftovers(leftovers=leftovers, resource=resource_obj)
+            else:
+                resource_cls, resource = futures[future]
+                leftovers.setdefault(resource_cls.kind, []).append(resource)
+
+    return leftovers
+
+
 def teardown_resources(
     session_store: dict[str, Any],
     ocp_client: DynamicClient,
@@ -89,7 +175,7 @@ def teardown_resources(
     Report if we have any leftovers in the cluster and return False if any, else return True
     """
     leftovers: dict[str, list[dict[str, str]]] = {}
-    session_teardown_resources: dict[str, list[dict[str, str]]] = session_store["teardown"]
+    session_teardown_resources = session_store["teardown"].snapshot()
     session_uuid = session_store["session_uuid"]
 
     # Resources that was created by the tests
@@ -110,107 +196,24 @@ def teardown_resources(
     pods = session_teardown_resources.get(Pod.kind, [])
     virtual_machines = session_teardown_resources.get(VirtualMachine.kind, [])
 
-    # Clean all resources that was created by the tests
-    for migration in migrations:
-        try:
-            migration_obj = Migration(name=migration["name"], namespace=migration["namespace"], client=ocp_client)
-            if not migration_obj.clean_up(wait=True):
-                leftovers = append_leftovers(leftovers=leftovers, resource=migration_obj)
-        except Exception as exc:
-            LOGGER.error(f"Failed to cleanup migration {migration['name']}: {exc}")
-            leftovers.setdefault(Migration.kind, []).append(migration)
-
-    for plan in plans:
-        try:
-            plan_obj = Plan(name=plan["name"], namespace=plan["namespace"], client=ocp_client)
-            if not plan_obj.clean_up(wait=True):
-                leftovers = append_leftovers(leftovers=leftovers, resource=plan_obj)
-        except Exception as exc:
-            LOGGER.error(f"Failed to cleanup plan {plan['name']}: {exc}")
-            leftovers.setdefault(Plan.kind, []).append(plan)
-
-    for provider in providers:
-        try:
-            provider_obj = Provider(name=provider["name"], namespace=provider["namespace"], client=ocp_client)
-            if not provider_obj.clean_up(wait=True):
-                leftovers = append_leftovers(leftovers=leftovers, resource=provider_obj)
-        except Exception as exc:
-            LOGGER.error(f"Failed to cleanup provider {provider['name']}: {exc}")
-            leftovers.setdefault(Provider.kind, []).append(provider)
-
-    for host in hosts:
-        try:
-            host_obj = Host(name=host["name"], namespace=host["namespace"], client=ocp_client)
-            if not host_obj.clean_up(wait=True):
-                leftovers = append_leftovers(leftovers=leftovers, resource=host_obj)
-        except Exception as exc:
-            LOGGER.error(f"Failed to cleanup host {host['name']}: {exc}")
-            leftovers.setdefault(Host.kind, []).append(host)
-
-    for secret in secrets:
-        try:
-            secret_obj = Secret(name=secret["name"], namespace=secret["namespace"], client=ocp_client)
-            if not secret_obj.clean_up(wait=True):
-                leftovers = append_leftovers(leftovers=leftovers, resource=secret_obj)
-        except Exception as exc:
-            LOGGER.error(f"Failed to cleanup secret {secret['name']}: {exc}")
-            leftovers.setdefault(Secret.kind, []).append(secret)
-
-    for network_attachment_definition in network_attachment_definitions:
-        try:
-            network_attachment_definition_obj = NetworkAttachmentDefinition(
-                name=network_attachment_definition["name"],
-                namespace=network_attachment_definition["namespace"],
-                client=ocp_client,
-            )
-            if not network_attachment_definition_obj.clean_up(wait=True):
-                leftovers = append_leftovers(leftovers=leftovers, resource=network_attachment_definition_obj)
-        except Exception as exc:
-            LOGGER.error(
-                f"Failed to cleanup NetworkAttachmentDefinition {network_attachment_definition['name']}: {exc}"
-            )
-            leftovers.setdefault(NetworkAttachmentDefinition.kind, []).append(network_attachment_definition)
-
-    for storagemap in storagemaps:
-        try:
-            storagemap_obj = StorageMap(name=storagemap["name"], namespace=storagemap["namespace"], client=ocp_client)
-            if not storagemap_obj.clean_up(wait=True):
-                leftovers = append_leftovers(leftovers=leftovers, resource=storagemap_obj)
-        except Exception as exc:
-            LOGGER.error(f"Failed to cleanup StorageMap {storagemap['name']}: {exc}")
-            leftovers.setdefault(StorageMap.kind, []).append(storagemap)
-
-    for networkmap in networkmaps:
-        try:
-            networkmap_obj = NetworkMap(name=networkmap["name"], namespace=networkmap["namespace"], client=ocp_client)
-            if not networkmap_obj.clean_up(wait=True):
-                leftovers = append_leftovers(leftovers=leftovers, resource=networkmap_obj)
-        except Exception as exc:
-            LOGGER.error(f"Failed to cleanup NetworkMap {networkmap['name']}: {exc}")
-            leftovers.setdefault(NetworkMap.kind, []).append(networkmap)
-
-    # Check that resources that was created by running migration are deleted
-    for virtual_machine in virtual_machines:
-        try:
-            virtual_machine_obj = VirtualMachine(
-                name=virtual_machine["name"], namespace=virtual_machine["namespace"], client=ocp_client
-            )
-            if virtual_machine_obj.exists:
-                if not virtual_machine_obj.clean_up(wait=True):
-                    leftovers = append_leftovers(leftovers=leftovers, resource=virtual_machine_obj)
-        except Exception as exc:
-            LOGGER.error(f"Failed to cleanup VirtualMachine {virtual_machine['name']}: {exc}")
-            leftovers.setdefault(VirtualMachine.kind, []).append(virtual_machine)
-
-    for pod in pods:
-        try:
-            pod_obj = Pod(name=pod["name"], namespace=pod["namespace"], client=ocp_client)
-            if pod_obj.exists:
-                if not pod_obj.clean_up(wait=True):
-                    leftovers = append_leftovers(leftovers=leftovers, resource=pod_obj)
-        except Exception as exc:
-            LOGGER.error(f"Failed to cleanup Pod {pod['name']}: {exc}")
-            leftovers.setdefault(Pod.kind, []).append(pod)
+    # Clean all resources that was created by the tests and check that resources that was created by running
+    # migration are deleted. All kinds are cleaned concurrently in a single bounded pool.
+    leftovers = clean_up_resources(
+        resources_to_clean=[
+            (Migration, migrations, False),
+            (Plan, plans, False),
+            (Provider, providers, False),
+            (Host, hosts, False),
+            (Secret, secrets, False),
+            (NetworkAttachmentDefinition, network_attachment_definitions, False),
+            (StorageMap, storagemaps, False),
+            (NetworkMap, networkmaps, False),
+            (VirtualMachine, virtual_machines, True),
+            (Pod, pods, True),
+        ],
+        ocp_client=ocp_client,
+        leftovers=leftovers,
+    )
 
     if target_namespace:
         try:
@@ -260,14 +263,10 @@ def teardown_resources(
             f"There are some leftovers after tests are done, delete tests namespaces may fail. Leftovers: {leftovers}"
         )
 
-    for namespace in namespaces:
-        try:
-            namespace_obj = Namespace(name=namespace["name"], client=ocp_client)
-            if not namespace_obj.clean_up(wait=True):
-                leftovers = append_leftovers(leftovers=leftovers, resource=namespace_obj)
-        except Exception as exc:
-            LOGGER.error(f"Failed to cleanup namespace {namespace['name']}: {exc}")
-            leftovers.setdefault(Namespace.kind, []).append(namespace)
+    # Namespaces are deleted last, after everything in them was cleaned
+    leftovers = clean_up_resources(
+        resources_to_clean=[(Namespace, namespaces, False)], ocp_client=ocp_client, leftovers=leftovers
+    )
 
     if vmware_cloned_vms:
         try:
@@ -1,3 +1,4 @@
+import threading
 from typing import Any
 
 import yaml
@@ -12,6 +13,31 @@ from utilities.naming import generate_name_with_uuid
 
 LOGGER = get_logger(__name__)
 
+# libyaml based loader when PyYAML was built with it, same safe semantics as yaml.safe_load
+_YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Module level so TeardownRegistry stays picklable, pytest-harvest dumps the session store from xdist workers
+_TEARDOWN_REGISTRY_LOCK = threading.Lock()
+
+
+class TeardownRegistry(dict[str, list[dict[str, str]]]):
+    """
+    Resources created by the tests, grouped by kind, to delete at session teardown.
+
+    Resources can be registered from several threads, use `add` to register and `snapshot` to iterate.
+    """
+
+    def add(self, kind: str, entry: dict[str, str]) -> None:
+        with _TEARDOWN_REGISTRY_LOCK:
+            self.setdefault(kind, []).append(entry)
+
+    def snapshot(self) -> dict[str, list[dict[str, str]]]:
+        """
+        Return a copy of the registered resources that is not affected by later additions.
+        """
+        with _TEARDOWN_REGISTRY_LOCK:
+            return {kind: list(entries) for kind, entries in self.items()}
+
 
 def create_and_store_resource(
     client: DynamicClient,
@@ -32,7 +58,7 @@ def create_and_store_resource(
     if not _resource_name:
         if _resource_yaml:
             with open(_resource_yaml) as fd:
-                _resource_dict = yaml.safe_load(fd)
+                _resource_dict = yaml.load(fd, Loader=_YAML_SAFE_LOADER)
 
         _resource_name = _resource_dict.get("metadata", {}).get("name")
 
@@ -62,6 +88,6 @@ def create_and_store_resource(
     if test_name:
         _resource_dict["test_name"] = test_name
 
-    fixture_store["teardown"].setdefault(_resource.kind, []).append(_resource_dict)
+    fixture_store["teardown"].add(kind=_resource.kind, entry=_resource_dict)
 
     return _resource
@@ -1,8 +1,8 @@
-import copy
 import functools
-import multiprocessing
 import os
+import threading
 from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import contextmanager, suppress
 from pathlib import Path
 from subprocess import STDOUT, check_output
@@ -34,35 +34,24 @@ from utilities.resources import create_and_store_resource
 
 LOGGER = get_logger(__name__)
 
+# Seconds to wait for openssl to fetch a provider certificate, avoids hanging on unreachable providers
+CA_CERT_FETCH_TIMEOUT: int = 15
 
-def vmware_provider(provider_data: dict[str, Any]) -> bool:
-    return provider_data["type"] == Provider.ProviderType.VSPHERE
+# String config values that are converted to booleans by get_value_from_py_config
+_CONFIG_BOOL_VALUES: dict[str, bool] = {"true": True, "false": False}
 
 
 def rhv_provider(provider_data: dict[str, Any]) -> bool:
     return provider_data["type"] == Provider.ProviderType.RHV
 
 
-def openstack_provider(provider_data: dict[str, Any]) -> bool:
-    return provider_data["type"] == Provider.ProviderType.OPENSTACK
-
-
-def ova_provider(provider_data: dict[str, Any]) -> bool:
-    return provider_data["type"] == Provider.ProviderType.OVA
-
-
-def ocp_provider(provider_data: dict[str, Any]) -> bool:
-    return provider_data["type"] == Provider.ProviderType.OPENSHIFT
-
-
 def generate_ca_cert_file(provider_fqdn: str, cert_file: Path) -> Path:
+    # Empty input closes the TLS session right after the handshake, same as `< /dev/null`
     cert = check_output(
-        [
-            "/bin/sh",
-            "-c",
-            f"openssl s_client -connect {provider_fqdn}:443 -showcerts < /dev/null",
-        ],
+        ["openssl", "s_client", "-connect", f"{provider_fqdn}:443", "-showcerts"],
+        input=b"",
         stderr=STDOUT,
+        timeout=CA_CERT_FETCH_TIMEOUT,
     )
 
     # Validate certificate data
@@ -111,8 +100,10 @@ def background(func):
 
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        proc = multiprocessing.Process(target=func, args=args, kwargs=kwargs)
-        proc.start()
+        # Decorated functions are I/O bound, a thread avoids forking and pickling the arguments
+        thread = threading.Thread(target=func, args=args, kwargs=kwargs, daemon=True)
+        thread.start()
+        return thread
 
     return wrapper
 
@@ -171,7 +162,10 @@ def create_source_provider(
     # common
     source_provider_secret: Secret | None = None
     source_provider: Any = None
-    source_provider_data_copy = copy.deepcopy(source_provider_data)
+    # Only top-level keys are overridden below, nested config (e.g. copyoffload) is only read
+    source_provider_data_copy = dict(source_provider_data)
+
+    provider_type = source_provider_data_copy["type"]
 
     # Check if copy-offload configuration is present
     has_copyoffload = "copyoffload" in source_provider_data_copy
@@ -186,16 +180,16 @@ def create_source_provider(
         "fixture_store": fixture_store,
     }
     metadata_labels = {
-        "createdForProviderType": source_provider_data_copy["type"],
+        "createdForProviderType": provider_type,
     }
 
-    if ocp_provider(provider_data=source_provider_data_copy):
+    if provider_type == Provider.ProviderType.OPENSHIFT:
         source_provider = OCPProvider
         source_provider_data_copy["api_url"] = ocp_admin_client.configuration.host
         source_provider_data_copy["type"] = Provider.ProviderType.OPENSHIFT
         source_provider_secret = destination_ocp_secret
 
-    elif vmware_provider(provider_data=source_provider_data_copy):
+    elif provider_type == Provider.ProviderType.VSPHERE:
         source_provider = VMWareProvider
         provider_args["host"] = source_provider_data_copy["fqdn"]
         secret_string_data["user"] = source_provider_data_copy["username"]
@@ -207,7 +201,7 @@ def create_source_provider(
         if not insecure:
             _fetch_and_store_cacert(source_provider_data_copy, secret_string_data, tmp_dir, session_uuid)
 
-    elif rhv_provider(provider_data=source_provider_data_copy):
+    elif provider_type == Provider.ProviderType.RHV:
         source_provider = OvirtProvider
         provider_args["host"] = source_provider_data_copy["api_url"]
         secret_string_data["user"] = source_provider_data_copy["username"]
@@ -223,7 +217,7 @@ def create_source_provider(
         else:
             provider_args["insecure"] = insecure
 
-    elif openstack_provider(provider_data=source_provider_data_copy):
+    elif provider_type == Provider.ProviderType.OPENSTACK:
         source_provider = OpenStackProvider
         provider_args["host"] = source_provider_data_copy["api_url"]
         provider_args["auth_url"] = source_provider_data_copy["api_url"]
@@ -242,7 +236,7 @@ def create_source_provider(
         if not insecure:
             _fetch_and_store_cacert(source_provider_data_copy, secret_string_data, tmp_dir, session_uuid)
 
-    elif ova_provider(provider_data=source_provider_data_copy):
+    elif provider_type == Provider.ProviderType.OVA:
         source_provider = OVAProvider
         provider_args["host"] = source_provider_data_copy["api_url"]
 
@@ -265,7 +259,7 @@ def create_source_provider(
 
     # Add copy-offload annotation only when copy-offload is configured
     provider_annotations = {}
-    if vmware_provider(provider_data=source_provider_data_copy) and has_copyoffload:
+    if provider_type == Provider.ProviderType.VSPHERE and has_copyoffload:
         provider_annotations["forklift.konveyor.io/empty-vddk-init-image"] = "yes"
 
     ocp_resource_provider = create_and_store_resource(
@@ -298,53 +292,47 @@ def create_source_cnv_vms(
     network_name: str,
     vm_name_suffix: str,
 ) -> None:
-    vms_to_create: list[VirtualMachine] = []
-
-    for vm_dict in vms:
-        vms_to_create.append(
-            create_and_store_resource(
-                resource=VirtualMachineFromInstanceType,
-                fixture_store=fixture_store,
-                name=f"{vm_dict['name']}{vm_name_suffix}",
-                namespace=namespace,
-                client=client,
-                instancetype_name="u1.small",
-                preference_name="rhel.9",
-                datasource_name="rhel9",
-                storage_size="30Gi",
-                additional_networks=[network_name],
-                cloud_init_user_data="""#cloud-config
+    if not vms:
+        return
+
+    def _create_vm(vm_dict: dict[str, Any]) -> None:
+        vm = create_and_store_resource(
+            resource=VirtualMachineFromInstanceType,
+            fixture_store=fixture_store,
+            name=f"{vm_dict['name']}{vm_name_suffix}",
+            namespace=namespace,
+            client=client,
+            instancetype_name="u1.small",
+            preference_name="rhel.9",
+            datasource_name="rhel9",
+            storage_size="30Gi",
+            additional_networks=[network_name],
+            cloud_init_user_data="""#cloud-config
 chpasswd:
 expire: false
 password: 123456
 user: rhel
 """,
-                run_strategy=VirtualMachine.RunStrategy.MANUAL,
-            ),
+            run_strategy=VirtualMachine.RunStrategy.MANUAL,
         )
 
-    for vm in vms_to_create:
         if not vm.ready:
             vm.start()
 
-    for vm in vms_to_create:
         vm.wait_for_ready_status(status=True)
 
+    # VMs are independent, create, start and wait for each of them concurrently
+    with ThreadPoolExecutor(max_workers=min(len(vms), 10)) as executor:
+        futures = [executor.submit(_create_vm, vm_dict) for vm_dict in vms]
+        for future in as_completed(futures):
+            future.result()
+
 
 def get_value_from_py_config(value: str) -> Any:
     config_value = py_config.get(value)
 
-    if not config_value:
-        return config_value
-
     if isinstance(config_value, str):
-        if config_value.lower() == "true":
-            return True
-
-        if config_value.lower() == "false":
-            return False
-
-        return config_value
+        return _CONFIG_BOOL_VALUES.get(config_value.lower(), config_value)
 
     return config_value
 
@@ -518,6 +506,8 @@ class VirtualMachineFromInstanceType(VirtualMachine):
             self.res["spec"] = spec
 
 
+# One client per process: avoids re-authenticating and opening new TLS connections for every caller
+@functools.cache
 def get_cluster_client() -> DynamicClient:
     host = get_value_from_py_config("cluster_host")
     username = get_value_from_py_config("cluster_username")